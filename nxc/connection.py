@@ -107,14 +107,8 @@ class connection:
             return
 
         if args.jitter:
-            jitter = args.jitter
-            if "-" in jitter:
-                start, end = jitter.split("-")
-                jitter = (int(start), int(end))
-            else:
-                jitter = (0, int(jitter))
-
-            value = random.choice(range(jitter[0], jitter[1]))
+            # jitter is parsed into an interval tuple once in main()
+            value = random.randint(args.jitter[0], args.jitter[1] - 1)
             self.logger.debug(f"Doin' the jitterbug for {value} second(s)")
             sleep(value)
 
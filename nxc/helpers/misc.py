@@ -17,6 +17,12 @@ def identify_target_file(target_file):
     return "unknown"
 
 
+def parse_range(range_str):
+    """Parse a 'start-end' string (or a bare upper bound) into an inclusive (start, end) tuple of ints"""
+    start, sep, end = range_str.partition("-")
+    return (int(start), int(end)) if sep else (0, int(range_str))
+
+
 def gen_random_string(length=10):
     return "".join(random.sample(string.ascii_letters, int(length)))
 
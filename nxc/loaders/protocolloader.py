@@ -7,14 +7,20 @@ import nxc
 
 
 class ProtocolLoader:
+    # cache loaded protocol modules by path, shared across loader instances so
+    # e.g. the db module isn't executed again for every ProtocolLoader created
+    _loaded_protocols = {}
+
     def __init__(self):
         self.nxc_path = expanduser("~/.nxc")
 
     def load_protocol(self, protocol_path):
-        loader = SourceFileLoader("protocol", protocol_path)
-        protocol = ModuleType(loader.name)
-        loader.exec_module(protocol)
-        return protocol
+        if protocol_path not in self._loaded_protocols:
+            loader = SourceFileLoader("protocol", protocol_path)
+            protocol = ModuleType(loader.name)
+            loader.exec_module(protocol)
+            self._loaded_protocols[protocol_path] = protocol
+        return self._loaded_protocols[protocol_path]
 
     def get_protocols(self):
         protocols = {}
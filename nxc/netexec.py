@@ -1,6 +1,6 @@
 import sys
 from nxc.helpers.logger import highlight
-from nxc.helpers.misc import identify_target_file
+from nxc.helpers.misc import identify_target_file, parse_range
 from nxc.parsers.ip import parse_targets
 from nxc.parsers.nmap import parse_nmap_xml
 from nxc.parsers.nessus import parse_nessus_file
@@ -13,10 +13,10 @@ from nxc.console import nxc_console
 from nxc.logger import nxc_logger
 from nxc.config import nxc_config, nxc_workspace, config_log, ignore_opsec
 from nxc.database import create_db_engine
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 import asyncio
 from nxc.helpers import powershell
-import shutil
 import os
 from os.path import exists
 from os.path import join as path_join
@@ -38,39 +38,105 @@ if platform.system() != "Windows":
 
 
 async def start_run(protocol_obj, args, db, targets):
-    futures = []
-    nxc_logger.debug("Creating ThreadPoolExecutor")
-    if args.no_progress or len(targets) == 1:
-        with ThreadPoolExecutor(max_workers=args.threads) as executor:
-            nxc_logger.debug(f"Creating thread for {protocol_obj}")
-            futures = [executor.submit(protocol_obj, args, db, target) for target in targets]
-    else:
-        with Progress(console=nxc_console) as progress, ThreadPoolExecutor(max_workers=args.threads) as executor:
-            current = 0
-            total = len(targets)
-            tasks = progress.add_task(
-                f"[green]Running nxc against {total} {'target' if total == 1 else 'targets'}",
-                total=total,
-            )
-            nxc_logger.debug(f"Creating thread for {protocol_obj}")
-            futures = [executor.submit(protocol_obj, args, db, target) for target in targets]
-            for _ in as_completed(futures):
-                current += 1
-                progress.update(tasks, completed=current)
-    for future in as_completed(futures):
+    loop = asyncio.get_running_loop()
+    # bounded queue gives automatic back-pressure: at most threads*4 targets are
+    # resident at once instead of one coroutine frame per target
+    queue = asyncio.Queue(maxsize=args.threads * 4)
+    produced = 0
+    completed = 0
+    progress = None
+    progress_task = None
+
+    async def worker():
+        nonlocal completed
+        while True:
+            target = await queue.get()
+            try:
+                # protocol objects are blocking (impacket & friends), so the
+                # connection itself still runs in a thread
+                await loop.run_in_executor(executor, protocol_obj, args, db, target)
+            except Exception:
+                nxc_logger.exception(f"Exception for target {target}")
+            finally:
+                completed += 1
+                if progress is not None:
+                    progress.update(progress_task, completed=completed)
+                queue.task_done()
+
+    async def produce():
+        nonlocal produced
+        for target in targets:
+            await queue.put(target)
+            produced += 1
+
+    # targets is lazy, so peek ahead to see whether we have more than one
+    # target without materializing the whole list
+    head = list(islice(targets, 2))
+    targets = chain(head, targets)
+
+    # a process pool is not an option here even for CPU-heavy protocols:
+    # protocol classes come from SourceFileLoader modules that aren't in
+    # sys.modules and db wraps a live engine, so neither survives pickling
+    nxc_logger.debug("Creating bounded ThreadPoolExecutor")
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        nxc_logger.debug(f"Creating {args.threads} workers for {protocol_obj}")
+        workers = [loop.create_task(worker()) for _ in range(args.threads)]
         try:
-            future.result()
-        except Exception:
-            nxc_logger.exception(f"Exception for target {targets[futures.index(future)]}: {future.exception()}")
+            if args.no_progress or len(head) == 1:
+                await produce()
+                await queue.join()
+            else:
+                with Progress(console=nxc_console) as progress:
+                    # total is unknown upfront; set it once the producer has
+                    # walked all targets so the bar can complete
+                    progress_task = progress.add_task("[green]Running nxc against targets", total=None)
+                    await produce()
+                    progress.update(progress_task, total=produced)
+                    await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            # wait for the cancellations to land so no worker task is left
+            # pending when the executor shuts down
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+def iter_targets(args):
+    """Lazily yield targets so large CIDRs and target files are never materialized in memory"""
+    if hasattr(args, "target") and args.target:
+        for target in args.target:
+            if exists(target) and os.path.isfile(target):
+                target_file_type = identify_target_file(target)
+                if target_file_type == "nmap":
+                    yield from parse_nmap_xml(target, args.protocol)
+                elif target_file_type == "nessus":
+                    yield from parse_nessus_file(target, args.protocol)
+                else:
+                    with open(target) as target_file:
+                        for target_entry in target_file:
+                            yield from parse_targets(target_entry.strip())
+            else:
+                yield from parse_targets(target)
 
 
 def main():
+    # use uvloop's C event loop when available; transparent speedup for the
+    # socket-heavy scan loop, no-op where uvloop isn't installed (e.g. Windows)
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     first_run_setup(nxc_logger)
     args = gen_cli_args()
 
     # if these are the same, it might double log to file (two FileHandlers will be added)
     # but this should never happen by accident
-    if config_log:
+    # skip the config-driven logfile for quick queries that exit right away (module listing/options),
+    # so they don't create and fsync a file for nothing; an explicit --log is still honored
+    if config_log and not (getattr(args, "list_modules", False) or getattr(args, "show_module_options", False)):
         nxc_logger.add_file_log()
     if hasattr(args, "log") and args.log:
         nxc_logger.add_file_log(args.log)
@@ -92,40 +158,38 @@ def main():
         exit(1)
 
     module_server = None
-    targets = []
+    targets = iter_targets(args)
     server_port_dict = {"http": 80, "https": 443, "smb": 445}
 
+    # parse ranged arguments once here instead of over and over in each connection
+    if args.jitter:
+        try:
+            args.jitter = parse_range(args.jitter)
+        except ValueError as e:
+            nxc_logger.error(f"Error parsing jitter interval: {e}")
+            exit(1)
+
     if hasattr(args, "cred_id") and args.cred_id:
+        expanded_cred_ids = []
         for cred_id in args.cred_id:
-            if "-" in str(cred_id):
-                start_id, end_id = cred_id.split("-")
+            if "-" in cred_id:
                 try:
-                    for n in range(int(start_id), int(end_id) + 1):
-                        args.cred_id.append(n)
-                    args.cred_id.remove(cred_id)
+                    start_id, end_id = parse_range(cred_id)
+                    expanded_cred_ids.extend(str(n) for n in range(start_id, end_id + 1))
                 except Exception as e:
                     nxc_logger.error(f"Error parsing database credential id: {e}")
                     exit(1)
-
-    if hasattr(args, "target") and args.target:
-        for target in args.target:
-            if exists(target) and os.path.isfile(target):
-                target_file_type = identify_target_file(target)
-                if target_file_type == "nmap":
-                    targets.extend(parse_nmap_xml(target, args.protocol))
-                elif target_file_type == "nessus":
-                    targets.extend(parse_nessus_file(target, args.protocol))
-                else:
-                    with open(target) as target_file:
-                        for target_entry in target_file:
-                            targets.extend(parse_targets(target_entry.strip()))
             else:
-                targets.extend(parse_targets(target))
+                expanded_cred_ids.append(cred_id)
+        args.cred_id = expanded_cred_ids
 
     # The following is a quick hack for the powershell obfuscation functionality, I know this is yucky
     if hasattr(args, "clear_obfscripts") and args.clear_obfscripts:
-        shutil.rmtree(os.path.expanduser("~/.nxc/obfuscated_scripts/"))
-        os.mkdir(os.path.expanduser("~/.nxc/obfuscated_scripts/"))
+        # unlink the cached scripts in place rather than rmtree+mkdir, which
+        # keeps the directory (and its permissions) intact
+        with os.scandir(os.path.expanduser("~/.nxc/obfuscated_scripts/")) as script_dir:
+            for script in script_dir:
+                os.unlink(script.path)
         nxc_logger.success("Cleared cached obfuscated PowerShell scripts")
 
     if hasattr(args, "obfs") and args.obfs:
@@ -133,9 +197,10 @@ def main():
 
     nxc_logger.debug(f"Protocol: {args.protocol}")
     p_loader = ProtocolLoader()
-    protocol_path = p_loader.get_protocols()[args.protocol]["path"]
+    protocol = p_loader.get_protocols()[args.protocol]
+    protocol_path = protocol["path"]
     nxc_logger.debug(f"Protocol Path: {protocol_path}")
-    protocol_db_path = p_loader.get_protocols()[args.protocol]["dbpath"]
+    protocol_db_path = protocol["dbpath"]
     nxc_logger.debug(f"Protocol DB Path: {protocol_db_path}")
 
     protocol_object = getattr(p_loader.load_protocol(protocol_path), args.protocol)
@@ -158,14 +223,17 @@ def main():
         modules = loader.list_modules()
 
     if args.list_modules:
-        nxc_logger.highlight("LOW PRIVILEGE MODULES")
+        low_privs = []
+        high_privs = []
         for name, props in sorted(modules.items()):
-            if args.protocol in props["supported_protocols"] and not props["requires_admin"]:
-                nxc_logger.display(f"{name:<25} {props['description']}")
+            if args.protocol in props["supported_protocols"]:
+                (high_privs if props["requires_admin"] else low_privs).append(f"{name:<25} {props['description']}")
+        nxc_logger.highlight("LOW PRIVILEGE MODULES")
+        for module_line in low_privs:
+            nxc_logger.display(module_line)
         nxc_logger.highlight("\nHIGH PRIVILEGE MODULES (requires admin privs)")
-        for name, props in sorted(modules.items()):
-            if args.protocol in props["supported_protocols"] and props["requires_admin"]:
-                nxc_logger.display(f"{name:<25} {props['description']}")
+        for module_line in high_privs:
+            nxc_logger.display(module_line)
         exit(0)
     elif args.module and args.show_module_options:
         for module in args.module:
@@ -195,15 +263,19 @@ def main():
                     if ans.lower() not in ["y", "yes", ""]:
                         exit(1)
 
-            if not module.multiple_hosts and len(targets) > 1:
-                ans = input(
-                    highlight(
-                        "[!] Running this module on multiple hosts doesn't really make any sense, are you sure you want to continue? [Y/n] ",
-                        "red",
+            if not module.multiple_hosts:
+                # peek at the lazy target iterator without consuming it
+                head = list(islice(targets, 2))
+                targets = chain(head, targets)
+                if len(head) > 1:
+                    ans = input(
+                        highlight(
+                            "[!] Running this module on multiple hosts doesn't really make any sense, are you sure you want to continue? [Y/n] ",
+                            "red",
+                        )
                     )
-                )
-                if ans.lower() not in ["y", "yes", ""]:
-                    exit(1)
+                    if ans.lower() not in ["y", "yes", ""]:
+                        exit(1)
 
             if hasattr(module, "on_request") or hasattr(module, "has_response"):
                 if hasattr(module, "required_server"):
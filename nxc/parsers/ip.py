@@ -17,9 +17,9 @@ def parse_targets(target):
                     yield str(ip)
         else:
             if ip_interface(target).ip.version == 6 and ip_address(target).is_link_local:
-                yield str(target)
+                yield target
             else:
                 for ip in ip_network(target, strict=False):
                     yield str(ip)
     except ValueError:
-        yield str(target)
+        yield target
@@ -1,4 +1,4 @@
-import xmltodict
+from xml.etree.ElementTree import iterparse
 
 # Ideally i'd like to be able to pull this info out dynamically from each protocol object but i'm a lazy bastard
 protocol_dict = {
@@ -11,31 +11,26 @@ protocol_dict = {
 
 
 def parse_nessus_file(nessus_file, protocol):
-    targets = []
-
-    def handle_nessus_file(path, item):
-        # Must return True otherwise xmltodict will throw a ParsingIterrupted() exception
-        # https://github.com/martinblech/xmltodict/blob/master/xmltodict.py#L219
-
-        if any("ReportHost" and "ReportItem" in values for values in path):
-            item = dict(path)
-            ip = item["ReportHost"]["name"]
-            if ip in targets:
-                return True
-
-            port = item["ReportItem"]["port"]
-            svc_name = item["ReportItem"]["svc_name"]
-
-            if port in protocol_dict[protocol]["ports"]:
-                targets.append(ip)
-            if svc_name in protocol_dict[protocol]["services"]:
-                targets.append(ip)
-
-            return True
-        else:
-            return True
-
-    with open(nessus_file) as file_handle:
-        xmltodict.parse(file_handle, item_depth=4, item_callback=handle_nessus_file)
-
-    return targets
+    """Stream targets out of a .nessus report
+
+    ReportHost elements are parsed incrementally with iterparse and cleared
+    once processed. The empty ReportHost shells stay attached to their parent
+    Report element until the file is done, but the bulky ReportItem children
+    are freed per host, which keeps memory bounded on large reports. Each host
+    is yielded at most once.
+    """
+    seen = set()
+
+    for _event, report_host in iterparse(nessus_file, events=("end",)):
+        if report_host.tag == "ReportHost":
+            ip = report_host.get("name")
+            if ip not in seen:
+                for item in report_host.iter("ReportItem"):
+                    port = int(item.get("port"))
+                    svc_name = item.get("svc_name")
+
+                    if port in protocol_dict[protocol]["ports"] or svc_name in protocol_dict[protocol]["services"]:
+                        seen.add(ip)
+                        yield ip
+                        break
+            report_host.clear()
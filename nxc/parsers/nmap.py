@@ -1,4 +1,4 @@
-from libnmap.parser import NmapParser
+from xml.etree.ElementTree import iterparse
 from nxc.logger import nxc_logger
 
 # right now we are only referencing the port numbers, not the service name, but this should be sufficient for 99% cases
@@ -15,14 +15,28 @@ protocol_dict = {
 
 
 def parse_nmap_xml(nmap_output_file, protocol):
-    nmap_report = NmapParser.parse_fromfile(nmap_output_file)
-    targets = []
+    """Stream targets out of an Nmap XML report
 
-    for host in nmap_report.hosts:
-        for port, _proto in host.get_open_ports():
-            if port in protocol_dict[protocol]["ports"]:
-                targets.append(host.ipv4)
-                break
-    nxc_logger.debug(f"Targets parsed from Nmap scan: {targets}")
+    The report is parsed incrementally with iterparse and each host element is
+    discarded once processed, so multi-MB scan files never sit in memory as a
+    full document tree.
+    """
+    context = iterparse(nmap_output_file, events=("start", "end"))
+    _, root = next(context)
 
-    return targets
+    for event, host in context:
+        if event == "end" and host.tag == "host":
+            ip = None
+            for address in host.iter("address"):
+                if address.get("addrtype") == "ipv4":
+                    ip = address.get("addr")
+                    break
+
+            if ip:
+                for port in host.iter("port"):
+                    state = port.find("state")
+                    if state is not None and state.get("state") == "open" and int(port.get("portid")) in protocol_dict[protocol]["ports"]:
+                        nxc_logger.debug(f"Target parsed from Nmap scan: {ip}")
+                        yield ip
+                        break
+            root.clear()